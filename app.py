@@ -1,10 +1,7 @@
+import threading
+
 import streamlit as st
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib import rcParams
-import pandas as pd
-from io import BytesIO
-import base64
 
 # 设置全局样式
 st.set_page_config(
@@ -14,10 +11,6 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# 设置Matplotlib中文字体
-rcParams['font.family'] = 'Microsoft YaHei'
-rcParams['axes.unicode_minus'] = False
-
 # 自定义CSS样式
 st.markdown("""
     <style>
@@ -94,6 +87,11 @@ with st.sidebar:
             θn = 360 - (θri + θfa + θre)
             st.metric("近休止角 (°)", f"{θn:.2f}")
 
+    with st.expander("高级参数", expanded=False):
+        N = st.slider("曲线分辨率 (点数)", min_value=181, max_value=2001, value=361, step=20,
+                      help="一周 0°~360°（含两端）的计算点数，角度间隔为 360/(点数-1)，"
+                           "同时决定导出数据的角度间隔；默认 361 点即每 1° 一个点，721 点为每 0.5°")
+
     if θn < 0:
         st.error("错误：总角度超过360°，请重新输入运动角参数！")
         st.stop()
@@ -110,115 +108,140 @@ with st.sidebar:
     st.caption("版本: 1.0 | 设计: 陈小秋是皮卡秋")
     st.caption("© 2025 机械原理课程设计")
 
-# 主内容区域
-if calculate_btn:
+
+# 凸轮角速度
+def angular_velocity(n):
+    """由转速 (rpm) 计算角速度 (rad/s)"""
+    return 2 * np.pi * n / 60
+
+
+# 正弦加速度运动规律（推程与回程共用）
+def sine_accel_motion(θ_rad, h, ω, β, s, v, a):
+    """计算单段正弦加速度运动的位移、速度和加速度，结果原地写入 s、v、a"""
+    # 相位角只计算一次，正弦值在位移和加速度中复用
+    t = θ_rad / β
+    φ = 2 * np.pi * t
+
+    # 以下均通过 out= 及原地运算完成，除 t、φ 外不再分配临时数组
+    sin_φ = np.sin(φ, out=a)
+    cos_φ = np.cos(φ, out=φ)
+
+    # s = h * (t - sin(φ) / 2π)
+    np.multiply(sin_φ, -1 / (2 * np.pi), out=s)
+    s += t
+    s *= h
+
+    # v = hω/β * (1 - cos(φ))
+    np.subtract(1, cos_φ, out=v)
+    v *= h * ω / β
+
+    # a = 2πhω²/β² * sin(φ)（a 中已存放 sin(φ)，须在位移计算之后缩放）
+    a *= 2 * np.pi * h * ω ** 2 / β ** 2
+
+
+# 凸轮运动学及轮廓计算（相同参数直接返回缓存结果）
+# st.cache_data 会序列化返回值并在每次命中时反序列化，因此只返回数据框一个对象；
+# 调用方通过 df.to_numpy().T 取得各行视图
+@st.cache_data(max_entries=32, show_spinner=False)
+def compute_cam(r0, h, n, e, k, θri, θfa, θre, N):
+    """计算推杆运动曲线及凸轮轮廓，返回各列依次为角度、位移、速度、加速度、轮廓X、轮廓Y的数据框"""
+    import pandas as pd
+
     # 计算角速度 (rad/s)
-    ω = 2 * np.pi * n / 60
+    ω = angular_velocity(n)
+
+    # 所有结果写入同一个 (6, N) 单精度缓冲区，各行依次为角度、位移、速度、加速度、轮廓X、轮廓Y
+    data = np.empty((6, N), dtype=np.float32)
+    θ_total, s, v, a, x, y = data
 
     # 角度数组 (度)
-    θ_total = np.linspace(0, 360, 1000)
+    θ_total[:] = np.linspace(0, 360, N, dtype=np.float32)
 
     # 转换为弧度
     θ_rad = np.deg2rad(θ_total)
 
-    # 初始化位移、速度、加速度数组
-    s = np.zeros_like(θ_total)
-    v = np.zeros_like(θ_total)
-    a = np.zeros_like(θ_total)
-
-    # 计算推程阶段 (正弦加速度)
-    θ_rise = θ_total[θ_total < θri]
-    β_rise = θ_ri_rad = np.deg2rad(θri)
-    θ_rise_rad = np.deg2rad(θ_rise)
-    s_rise = h * (θ_rise_rad / β_rise - np.sin(2 * np.pi * θ_rise_rad / β_rise) / (2 * np.pi))
-    v_rise = (h * ω / β_rise) * (1 - np.cos(2 * np.pi * θ_rise_rad / β_rise))
-    a_rise = (2 * np.pi * h * ω ** 2 / β_rise ** 2) * np.sin(2 * np.pi * θ_rise_rad / β_rise)
-
-    # 远休止阶段
-    θ_dwell1 = θ_total[(θ_total >= θri) & (θ_total < (θri + θfa))]
-    s_dwell1 = np.full_like(θ_dwell1, h)
-    v_dwell1 = np.zeros_like(θ_dwell1)
-    a_dwell1 = np.zeros_like(θ_dwell1)
-
-    # 回程阶段 (正弦加速度)
-    θ_return = θ_total[(θ_total >= (θri + θfa)) & (θ_total < (θri + θfa + θre))]
+    # 各阶段分界角
     θ_return_start = θri + θfa
-    β_return = θ_re_rad = np.deg2rad(θre)
-    θ_return_rad = np.deg2rad(θ_return - θ_return_start)
-    s_return = h * (1 - θ_return_rad / β_return + np.sin(2 * np.pi * θ_return_rad / β_return) / (2 * np.pi))
-    v_return = (h * ω / β_return) * (-1 + np.cos(2 * np.pi * θ_return_rad / β_return))
-    a_return = (-2 * np.pi * h * ω ** 2 / β_return ** 2) * np.sin(2 * np.pi * θ_return_rad / β_return)
-
-    # 近休止阶段
-    θ_dwell2 = θ_total[(θ_total >= (θri + θfa + θre)) & (θ_total <= 360)]
-    s_dwell2 = np.zeros_like(θ_dwell2)
-    v_dwell2 = np.zeros_like(θ_dwell2)
-    a_dwell2 = np.zeros_like(θ_dwell2)
-
-    # 合并所有阶段
-    s = np.concatenate((s_rise, s_dwell1, s_return, s_dwell2))
-    v = np.concatenate((v_rise, v_dwell1, v_return, v_dwell2))
-    a = np.concatenate((a_rise, a_dwell1, a_return, a_dwell2))
-
-    # 计算凸轮轮廓
-    if k == -1:  # 顺时针
-        x = (r0 + s) * np.sin(θ_rad) + e * np.cos(θ_rad)
-        y = (r0 + s) * np.cos(θ_rad) - e * np.sin(θ_rad)
-    else:  # 逆时针
-        x = (r0 + s) * np.sin(θ_rad) - e * np.cos(θ_rad)
-        y = (r0 + s) * np.cos(θ_rad) + e * np.sin(θ_rad)
-
-    # 创建数据框用于下载
-    df = pd.DataFrame({
-        '角度(度)': θ_total,
-        '位移(mm)': s,
-        '速度(mm/s)': v,
-        '加速度(mm/s²)': a,
-        '轮廓X(mm)': x,
-        '轮廓Y(mm)': y
-    })
+    edges = np.array([θri, θ_return_start, θ_return_start + θre])
 
-    # 计算关键参数
-    max_velocity = np.max(v)
-    min_velocity = np.min(v)
-    max_acceleration = np.max(a)
-    min_acceleration = np.min(a)
-    rotation_direction = "逆时针" if k == 1 else "顺时针"
+    # 划分运动阶段：[:i0] 推程、[i0:i1] 远休止、[i1:i2] 回程、[i2:] 近休止
+    # 角度单调递增，直接在角度数组中查找分界角即得切片位置（切片为视图，无需复制）
+    i0, i1, i2 = np.searchsorted(θ_total, edges, side='left')
 
-    # 参数汇总表格
-    st.subheader("设计参数汇总")
-    col1, col2 = st.columns(2)
-    with col1:
-        st.markdown(f"""
-        | 参数 | 值 |
-        |---|---|
-        | **基圆半径 (mm)** | {r0:.2f} |
-        | **推杆最大位移 (mm)** | {h:.2f} |
-        | **凸轮转速 (rpm)** | {n:.2f} |
-        | **旋转方向** | {rotation_direction} |
-        | **推程运动角 (°)** | {θri:.2f} |
-        | **远休止角 (°)** | {θfa:.2f} |
-        """)
+    # 计算推程阶段 (正弦加速度)，各阶段直接写入缓冲区对应切片
+    β_rise = float(np.deg2rad(θri))
+    sine_accel_motion(θ_rad[:i0], h, ω, β_rise, s[:i0], v[:i0], a[:i0])
 
-    with col2:
-        st.markdown(f"""
-        | 参数 | 值 |
-        |---|---|
-        | **回程运动角 (°)** | {θre:.2f} |
-        | **近休止角 (°)** | {θn:.2f} |
-        | **偏距 (mm)** | {e:.2f} |
-        | **角速度 (rad/s)** | {ω:.2f} |
-        | **最大速度 (mm/s)** | {max_velocity:.2f} |
-        | **最小速度 (mm/s)** | {min_velocity:.2f} |
-        | **最大加速度 (mm/s²)** | {max_acceleration:.2f} |
-        | **最小加速度 (mm/s²)** | {min_acceleration:.2f} |
-        """)
+    # 远休止阶段
+    s[i0:i1] = h
+    v[i0:i1] = 0
+    a[i0:i1] = 0
+
+    # 回程阶段 (正弦加速度，与推程关于行程中点对称)
+    β_return = float(np.deg2rad(θre))
+    s_return, v_return, a_return = s[i1:i2], v[i1:i2], a[i1:i2]
+    sine_accel_motion(θ_rad[i1:i2] - float(np.deg2rad(θ_return_start)), h, ω, β_return,
+                      s_return, v_return, a_return)
+    np.subtract(h, s_return, out=s_return)
+    np.negative(v_return, out=v_return)
+    np.negative(a_return, out=a_return)
 
-    # 创建图表
-    st.subheader("运动曲线分析")
+    # 近休止阶段
+    s[i2:] = 0
+    v[i2:] = 0
+    a[i2:] = 0
+
+    # 计算凸轮轮廓（k=1 逆时针，k=-1 顺时针）
+    # x = (r0 + s)sinθ - k·e·cosθ，y = (r0 + s)cosθ + k·e·sinθ，原地运算减少临时数组
+    sin_θ = np.sin(θ_rad)
+    cos_θ = np.cos(θ_rad)
+    r = r0 + s
+    np.multiply(r, sin_θ, out=x)
+    np.multiply(r, cos_θ, out=y)
+    cos_θ *= k * e
+    sin_θ *= k * e
+    x -= cos_θ
+    y += sin_θ
+
+    # 创建数据框（包装缓冲区的转置视图，构造时不复制数据）
+    df = pd.DataFrame(data.T, columns=['角度(度)', '位移(mm)', '速度(mm/s)', '加速度(mm/s²)', '轮廓X(mm)', '轮廓Y(mm)'],
+                      copy=False)
+
+    return df
+
+
+# make_figs 返回的图表对象在所有会话间共享，而 Matplotlib 非线程安全，
+# savefig 期间会临时修改图表的 dpi 与布局，因此编码图片时须加锁。
+# 脚本每次重运行都在新的模块对象中执行，模块级变量不能跨会话共享，
+# 故通过 st.cache_resource 保证整个进程只有一把锁
+@st.cache_resource
+def savefig_lock():
+    """返回进程内唯一的 savefig 锁"""
+    return threading.Lock()
+
+
+# 运动曲线及轮廓图表（按参数缓存图表对象，直接使用 Figure 而不经过 pyplot 注册）
+@st.cache_resource(max_entries=8)
+def make_figs(r0, h, n, e, k, θri, θfa, θre, N):
+    """绘制位移、速度、加速度曲线及凸轮轮廓图"""
+    # Matplotlib 仅在需要绘图时导入，首次加载页面及调整参数时不产生导入开销
+    import matplotlib
+    matplotlib.use('Agg')
+    from matplotlib import rcParams
+    from matplotlib.collections import LineCollection
+    from matplotlib.figure import Figure
+    from matplotlib.patches import Circle
+
+    # 设置Matplotlib中文字体
+    rcParams['font.family'] = 'Microsoft YaHei'
+    rcParams['axes.unicode_minus'] = False
+
+    θ_total, s, v, a, x, y = compute_cam(r0, h, n, e, k, θri, θfa, θre, N).to_numpy().T
+    θn = 360 - (θri + θfa + θre)
 
     # 位移曲线
-    fig1, ax1 = plt.subplots(figsize=(10, 5))
+    fig1 = Figure(figsize=(10, 5))
+    ax1 = fig1.subplots()
     ax1.plot(θ_total, s, 'b-', linewidth=2.5, label='位移')
     ax1.fill_between(θ_total, 0, s, color='#1f77b4', alpha=0.2)
     ax1.set_title('推杆位移曲线', fontsize=14, fontweight='bold')
@@ -228,60 +251,58 @@ if calculate_btn:
     ax1.legend(loc='upper right', fontsize=12)
     ax1.set_xlim(0, 360)
     ax1.set_ylim(0, h * 1.2)
-    ax1.axvline(x=θri, color='r', linestyle='--', alpha=0.5)
-    ax1.axvline(x=θri + θfa, color='r', linestyle='--', alpha=0.5)
-    ax1.axvline(x=θri + θfa + θre, color='r', linestyle='--', alpha=0.5)
-    ax1.text(θri / 2, h * 1.1, '推程', ha='center', fontsize=11, color='darkblue')
-    ax1.text(θri + θfa / 2, h * 1.1, '远休止', ha='center', fontsize=11, color='darkblue')
-    ax1.text(θri + θfa + θre / 2, h * 1.1, '回程', ha='center', fontsize=11, color='darkblue')
-    ax1.text(θri + θfa + θre + θn / 2, h * 1.1, '近休止', ha='center', fontsize=11, color='darkblue')
-    st.pyplot(fig1)
-
-    # 速度和加速度曲线
-    col1, col2 = st.columns(2)
-    with col1:
-        fig2, ax2 = plt.subplots(figsize=(8, 4))
-        ax2.plot(θ_total, v, 'g-', linewidth=2.5, label='速度')
-        ax2.fill_between(θ_total, 0, v, where=v >= 0, color='green', alpha=0.2)
-        ax2.fill_between(θ_total, 0, v, where=v < 0, color='red', alpha=0.2)
-        ax2.set_title('推杆速度曲线', fontsize=14, fontweight='bold')
-        ax2.set_xlabel('凸轮转角 (°)', fontsize=12)
-        ax2.set_ylabel('速度 (mm/s)', fontsize=12)
-        ax2.grid(True, linestyle='--', alpha=0.7)
-        ax2.legend(loc='upper right', fontsize=12)
-        ax2.set_xlim(0, 360)
-        v_max = np.max(np.abs(v)) * 1.2
-        ax2.set_ylim(-v_max, v_max)
-        ax2.axhline(y=0, color='k', linestyle='-', alpha=0.5)
-        st.pyplot(fig2)
-
-    with col2:
-        fig3, ax3 = plt.subplots(figsize=(8, 4))
-        ax3.plot(θ_total, a, 'r-', linewidth=2.5, label='加速度')
-        ax3.fill_between(θ_total, 0, a, where=a >= 0, color='red', alpha=0.2)
-        ax3.fill_between(θ_total, 0, a, where=a < 0, color='green', alpha=0.2)
-        ax3.set_title('推杆加速度曲线', fontsize=14, fontweight='bold')
-        ax3.set_xlabel('凸轮转角 (°)', fontsize=12)
-        ax3.set_ylabel('加速度 (mm/s²)', fontsize=12)
-        ax3.grid(True, linestyle='--', alpha=0.7)
-        ax3.legend(loc='upper right', fontsize=12)
-        ax3.set_xlim(0, 360)
-        a_max = np.max(np.abs(a)) * 1.2
-        ax3.set_ylim(-a_max, a_max)
-        ax3.axhline(y=0, color='k', linestyle='-', alpha=0.5)
-        st.pyplot(fig3)
+    # 阶段分界线（合并为一个 LineCollection）及阶段名称
+    widths = np.array([θri, θfa, θre, θn])
+    bounds = np.cumsum(widths)
+    ax1.add_collection(LineCollection([[(b, 0), (b, h * 1.2)] for b in bounds[:3]],
+                                      colors='r', linestyles='--', alpha=0.5))
+    centers = bounds - widths / 2
+    for center, label in zip(centers, ['推程', '远休止', '回程', '近休止']):
+        ax1.text(center, h * 1.1, label, ha='center', fontsize=11, color='darkblue')
+
+    # 速度曲线
+    fig2 = Figure(figsize=(8, 4))
+    ax2 = fig2.subplots()
+    ax2.plot(θ_total, v, 'g-', linewidth=2.5, label='速度')
+    ax2.fill_between(θ_total, 0, np.maximum(v, 0), color='green', alpha=0.2)
+    ax2.fill_between(θ_total, 0, np.minimum(v, 0), color='red', alpha=0.2)
+    ax2.set_title('推杆速度曲线', fontsize=14, fontweight='bold')
+    ax2.set_xlabel('凸轮转角 (°)', fontsize=12)
+    ax2.set_ylabel('速度 (mm/s)', fontsize=12)
+    ax2.grid(True, linestyle='--', alpha=0.7)
+    ax2.legend(loc='upper right', fontsize=12)
+    ax2.set_xlim(0, 360)
+    v_max = np.max(np.abs(v)) * 1.2
+    ax2.set_ylim(-v_max, v_max)
+    ax2.axhline(y=0, color='k', linestyle='-', alpha=0.5)
+
+    # 加速度曲线
+    fig3 = Figure(figsize=(8, 4))
+    ax3 = fig3.subplots()
+    ax3.plot(θ_total, a, 'r-', linewidth=2.5, label='加速度')
+    ax3.fill_between(θ_total, 0, np.maximum(a, 0), color='red', alpha=0.2)
+    ax3.fill_between(θ_total, 0, np.minimum(a, 0), color='green', alpha=0.2)
+    ax3.set_title('推杆加速度曲线', fontsize=14, fontweight='bold')
+    ax3.set_xlabel('凸轮转角 (°)', fontsize=12)
+    ax3.set_ylabel('加速度 (mm/s²)', fontsize=12)
+    ax3.grid(True, linestyle='--', alpha=0.7)
+    ax3.legend(loc='upper right', fontsize=12)
+    ax3.set_xlim(0, 360)
+    a_max = np.max(np.abs(a)) * 1.2
+    ax3.set_ylim(-a_max, a_max)
+    ax3.axhline(y=0, color='k', linestyle='-', alpha=0.5)
 
     # 凸轮轮廓
-    st.subheader("凸轮轮廓设计")
-    fig4, ax4 = plt.subplots(figsize=(8, 8))
+    fig4 = Figure(figsize=(8, 8))
+    ax4 = fig4.subplots()
 
     # 绘制基圆
-    base_circle = plt.Circle((0, 0), r0, fill=False, color='blue', linestyle='--', alpha=0.7)
+    base_circle = Circle((0, 0), r0, fill=False, color='blue', linestyle='--', alpha=0.7)
     ax4.add_patch(base_circle)
 
     # 绘制偏距圆
     if e > 0:
-        offset_circle = plt.Circle((0, 0), e, fill=False, color='green', linestyle=':', alpha=0.7)
+        offset_circle = Circle((0, 0), e, fill=False, color='green', linestyle=':', alpha=0.7)
         ax4.add_patch(offset_circle)
 
     # 绘制凸轮轮廓
@@ -302,54 +323,146 @@ if calculate_btn:
     ax4.plot(0, 0, 'ko', markersize=8)
     ax4.text(0, -3, 'O', fontsize=12, ha='center')
 
-    st.pyplot(fig4)
+    return fig1, fig2, fig3, fig4
 
-    # 数据下载功能
-    st.subheader("数据导出")
-    st.markdown("### 计算结果数据")
 
-    # 显示数据预览
-    st.dataframe(df.head(10))
+# 计算结果导出为CSV（编码结果缓存，条目数与 compute_cam 一致）
+@st.cache_data(max_entries=32, show_spinner=False)
+def df_to_csv_bytes(df):
+    """将数据框编码为CSV字节串（使用 PyArrow 的 C++ CSV 写入器）"""
+    # PyArrow 为 Streamlit 的依赖项，无需额外安装。
+    # 输出格式：表头带引号，数值保留4位小数后按最短形式写出（如 20、1.5、-3.1416）
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+
+    table = pa.Table.from_pandas(df.round(4), preserve_index=False)
+    buf = pa.BufferOutputStream()
+    pacsv.write_csv(table, buf)
+    return buf.getvalue().to_pybytes()
 
 
-    # 创建下载链接
-    def get_table_download_link(df, filename):
-        """生成下载链接"""
-        csv = df.to_csv(index=False)
-        b64 = base64.b64encode(csv.encode()).decode()
-        href = f'<a href="data:file/csv;base64,{b64}" download="{filename}">下载CSV文件</a>'
-        return href
+# 图表渲染为PNG（按参数及分辨率缓存编码结果，供页面显示和下载使用）
+# 每组参数最多 6 幅图片（4 幅显示图 + 2 幅下载图），条目数对应 make_figs 缓存的 8 组参数
+@st.cache_data(max_entries=48, show_spinner=False)
+def fig_to_png_bytes(params, index, dpi):
+    """将 make_figs 生成的第 index 幅图编码为PNG字节串"""
+    from io import BytesIO
 
+    fig = make_figs(*params)[index]
+    buf = BytesIO()
+    with savefig_lock():
+        fig.savefig(buf, format="png", dpi=dpi, bbox_inches="tight")
+    return buf.getvalue()
 
+
+# 数据导出区域（局部重运行，点击下载按钮不会触发整个脚本重新计算）
+@st.fragment
+def downloads_section(df, params):
+    """显示数据预览及CSV、图表下载按钮"""
+    # 显示数据预览
+    st.dataframe(df.head(10))
+
+    # 数据下载
     col1, col2, col3 = st.columns(3)
     with col1:
-        st.markdown(get_table_download_link(df, "凸轮设计数据.csv"), unsafe_allow_html=True)
+        st.download_button(
+            label="下载CSV文件",
+            data=df_to_csv_bytes(df),
+            file_name="凸轮设计数据.csv",
+            mime="text/csv"
+        )
 
-    # 图表下载
+    # 图表下载（传入函数，点击按钮时才生成高分辨率图片）
     with col2:
         # 位移图下载
-        buf = BytesIO()
-        fig1.savefig(buf, format="png", dpi=120)
-        buf.seek(0)
         st.download_button(
             label="下载位移图",
-            data=buf,
+            data=lambda: fig_to_png_bytes(params, 0, dpi=200),
             file_name="位移曲线.png",
             mime="image/png"
         )
 
     with col3:
         # 轮廓图下载
-        buf = BytesIO()
-        fig4.savefig(buf, format="png", dpi=120)
-        buf.seek(0)
         st.download_button(
             label="下载轮廓图",
-            data=buf,
+            data=lambda: fig_to_png_bytes(params, 3, dpi=200),
             file_name="凸轮轮廓.png",
             mime="image/png"
         )
 
+
+# 主内容区域
+if calculate_btn:
+    # 计算角速度 (rad/s)
+    ω = angular_velocity(n)
+
+    # 计算运动曲线及凸轮轮廓（汇总表只需速度、加速度）
+    params = (r0, h, n, e, k, θri, θfa, θre, N)
+    df = compute_cam(*params)
+    _, _, v, a, _, _ = df.to_numpy().T
+
+    # 计算关键参数
+    max_velocity = np.max(v)
+    min_velocity = np.min(v)
+    max_acceleration = np.max(a)
+    min_acceleration = np.min(a)
+    rotation_direction = "逆时针" if k == 1 else "顺时针"
+
+    # 参数汇总表格
+    st.subheader("设计参数汇总")
+    col1, col2 = st.columns(2)
+    with col1:
+        st.markdown(f"""
+        | 参数 | 值 |
+        |---|---|
+        | **基圆半径 (mm)** | {r0:.2f} |
+        | **推杆最大位移 (mm)** | {h:.2f} |
+        | **凸轮转速 (rpm)** | {n:.2f} |
+        | **旋转方向** | {rotation_direction} |
+        | **推程运动角 (°)** | {θri:.2f} |
+        | **远休止角 (°)** | {θfa:.2f} |
+        """)
+
+    with col2:
+        st.markdown(f"""
+        | 参数 | 值 |
+        |---|---|
+        | **回程运动角 (°)** | {θre:.2f} |
+        | **近休止角 (°)** | {θn:.2f} |
+        | **偏距 (mm)** | {e:.2f} |
+        | **角速度 (rad/s)** | {ω:.2f} |
+        | **最大速度 (mm/s)** | {max_velocity:.2f} |
+        | **最小速度 (mm/s)** | {min_velocity:.2f} |
+        | **最大加速度 (mm/s²)** | {max_acceleration:.2f} |
+        | **最小加速度 (mm/s²)** | {min_acceleration:.2f} |
+        """)
+
+    # 创建图表（页面显示使用较低分辨率，高分辨率图片在点击下载按钮时才生成）
+    # 图片拉伸至容器宽度；按显示位置选择 dpi，使整行图约 1200 像素宽、半栏图约 640 像素宽
+    st.subheader("运动曲线分析")
+
+    # 位移曲线（10 英寸宽，整行显示）
+    st.image(fig_to_png_bytes(params, 0, dpi=120), width="stretch")
+
+    # 速度和加速度曲线（8 英寸宽，半栏显示）
+    col1, col2 = st.columns(2)
+    with col1:
+        st.image(fig_to_png_bytes(params, 1, dpi=80), width="stretch")
+
+    with col2:
+        st.image(fig_to_png_bytes(params, 2, dpi=80), width="stretch")
+
+    # 凸轮轮廓（8 英寸见方，整行显示）
+    st.subheader("凸轮轮廓设计")
+    st.image(fig_to_png_bytes(params, 3, dpi=150), width="stretch")
+
+    # 数据下载功能
+    st.subheader("数据导出")
+    st.markdown("### 计算结果数据")
+
+    downloads_section(df, params)
+
     # 添加设计信息
     st.markdown("---")
     st.caption(f"凸轮轮廓设计及运动仿真 | 设计时间: 2025年 | 采用正弦加速度运动规律")
@@ -376,6 +489,7 @@ else:
     - **远休止角**：推杆在最高位置停留对应的凸轮转角
     - **回程运动角**：推杆下降过程对应的凸轮转角
     - **近休止角**：推杆在最低位置停留对应的凸轮转角（自动计算）
+    - **曲线分辨率**：一周 0°~360°（含两端）的计算点数，角度间隔为 360/(点数-1)，决定曲线精细程度及导出数据的角度间隔；默认 361 点即每 1° 一个点（高级参数）
     """)
 
 